@@ -0,0 +1,447 @@
+# Fast computation of the medcouple, a robust measure of skewness.
+#
+# Implements the O(n log n) medcouple algorithm of Brys, Hubert, and
+# Struyf, using the kth-pair selection technique of Johnson and
+# Mizoguchi. Results agreed with a brute-force O(n^2) implementation
+# on random data, but this code has not been validated against
+# standard implementations.
+#
+# Created: August 28, 2026
+#
+# Python Version: 3.12
+#
+# Dependencies: numpy, numba
+#
+# Author: Mustafa Hussain <h.mustafa.mail@gmail.com>
+#
+# License: CC BY-SA https://creativecommons.org/licenses/by-sa/4.0/
+#
+# You are free to share and adapt as long as you give appropriate
+# credit to the author and any derivatives of this work are shared
+# under the same license as the original.
+#
+# Disclaimer: The software is provided "as is", without warranty
+# of any kind, express or implied, including but not limited
+# to the warranties of merchantability, fitness for a particular
+# purpose and noninfringement. In no event shall the authors or
+# copyright holders be liable for any claim, damages or other
+# liability, whether in an action of contract, tort or otherwise,
+# arising from, out of or in connection with the software or the
+# use or other dealings in the software.
+
+
+import numpy as np
+
+from numba import njit
+
+
+def wmedian(A, W):
+    """
+    Computes the weighted median of A with integer weights W.
+
+    Sorts once, then resolves the weighted median with a prefix sum
+    over the sorted weights and a single binary search on cumulative
+    weight, rather than rescanning A on every bisection step.
+
+    Parameters:
+    - A (sequence of float): Values
+    - W (sequence of int): Corresponding positive integer weights
+
+    Returns:
+    - float: The lower weighted median of A
+    """
+
+    # Work on NumPy arrays
+    A = np.asarray(A, dtype=np.float64)
+    W = np.asarray(W, dtype=np.int64)
+
+    # Sort values and carry the weights along
+    order = np.argsort(A)
+    As = A[order]
+    Ws = W[order]
+
+    # Cumulative weight up to and including each sorted value
+    cum = np.cumsum(Ws)
+
+    # Half the total weight, rounded up
+    target = (cum[-1] + 1) // 2
+
+    # Smallest index whose cumulative weight reaches the target
+    idx = np.searchsorted(cum, target)
+
+    return As[idx]
+
+
+@njit(cache=True)
+def _center_scale(Z, med, den):
+    """
+    Normalizes Z to (z - med) / den in place, in one pass, instead
+    of separate subtract and divide traversals.
+    """
+
+    for k in range(Z.size):
+        Z[k] = (Z[k] - med) / den
+
+
+@njit(cache=True)
+def _h_pair(Zplus, Zminus, n_plus, i, j, eps2):
+    """
+    Scalar kernel value at (i, j), with the signum tie-break for
+    pairs within epsilon of each other.
+    """
+
+    a = Zplus[i]
+    b = Zminus[j]
+
+    if abs(a - b) <= 2 * eps2:
+        t = n_plus - 1 - i - j
+        return 1.0 * ((t > 0) - (t < 0))
+
+    return (a + b) / (a - b)
+
+
+@njit(cache=True)
+def _wmedian(A, W):
+    """
+    Lower weighted median of A with positive integer weights W, by
+    weighted quickselect: three-way partition around a pivot, keep
+    the side holding half the total weight, repeat. Expected O(m),
+    with no sort at all. A and W are scratch buffers and come back
+    permuted.
+    """
+
+    # Half the total weight, rounded up; the answer is the smallest
+    # value whose cumulative weight reaches this target
+    target = (W.sum() + 1) // 2
+
+    lo = 0
+    hi = A.size
+
+    # Weight of everything discarded below the current segment
+    wleft = 0
+
+    while hi - lo > 1:
+
+        # Median-of-three pivot against sorted or reversed runs
+        p0 = A[lo]
+        p1 = A[(lo + hi) // 2]
+        p2 = A[hi - 1]
+        pivot = max(min(p0, p1), min(max(p0, p1), p2))
+
+        # Three-way partition of the segment around the pivot,
+        # carrying the weights along with the values
+        lt = lo
+        i = lo
+        gt = hi
+        while i < gt:
+            if A[i] < pivot:
+                A[i], A[lt] = A[lt], A[i]
+                W[i], W[lt] = W[lt], W[i]
+                lt += 1
+                i += 1
+            elif A[i] > pivot:
+                gt -= 1
+                A[i], A[gt] = A[gt], A[i]
+                W[i], W[gt] = W[gt], W[i]
+            else:
+                i += 1
+
+        # Cumulative weight strictly below, and tied with, the pivot
+        wless = wleft
+        for k in range(lo, lt):
+            wless += W[k]
+        weq = 0
+        for k in range(lt, gt):
+            weq += W[k]
+
+        if wless >= target:
+            # The weighted median is below the pivot
+            hi = lt
+        elif wless + weq >= target:
+            # The pivot itself carries the target weight
+            return pivot
+        else:
+            # The weighted median is above the pivot
+            wleft = wless + weq
+            lo = gt
+
+    return A[lo]
+
+
+@njit(cache=True)
+def _cmp_above(Zplus, Zminus, n_plus, i, j, eps2, threshold):
+    """
+    Whether the kernel value at (i, j) exceeds threshold, without
+    performing the kernel division: (a + b) / (a - b) > t is
+    compared as a + b against t * (a - b) with the sign of the
+    denominator folded in, a multiply instead of a divide on the
+    hottest comparison in the sweep.
+    """
+
+    a = Zplus[i]
+    b = Zminus[j]
+    d = a - b
+
+    # Pairs within epsilon of each other take the signum rule
+    if abs(d) <= 2 * eps2:
+        t = n_plus - 1 - i - j
+        return 1.0 * ((t > 0) - (t < 0)) > threshold
+
+    if d > 0.0:
+        return a + b > threshold * d
+    return a + b < threshold * d
+
+
+@njit(cache=True)
+def _cmp_below(Zplus, Zminus, n_plus, i, j, eps2, threshold):
+    """
+    Whether the kernel value at (i, j) lies below threshold, in the
+    same division-free form as _cmp_above.
+    """
+
+    a = Zplus[i]
+    b = Zminus[j]
+    d = a - b
+
+    # Pairs within epsilon of each other take the signum rule
+    if abs(d) <= 2 * eps2:
+        t = n_plus - 1 - i - j
+        return 1.0 * ((t > 0) - (t < 0)) < threshold
+
+    if d > 0.0:
+        return a + b < threshold * d
+    return a + b > threshold * d
+
+
+@njit(cache=True)
+def _p_sweep(Zplus, Zminus, n_plus, n_minus, h_med, eps2, h_med_eps, P):
+    """
+    Two-pointer sweep locating, for every row, the rightmost column
+    with kernel value above h_med, written into the P buffer. The
+    column pointer is monotone across rows, so no (i, j) pair is
+    evaluated twice and the sweep is O(n_plus + n_minus).
+    """
+
+    # Band edge, hoisted out of the scans
+    upper = h_med + h_med_eps
+
+    # Rightmost column in each row strictly greater than h_med,
+    # filling P from the last row downward
+    j = 0
+    for i in range(n_plus - 1, -1, -1):
+        while j < n_minus and \
+                _cmp_above(Zplus, Zminus, n_plus, i, j, eps2, upper):
+            j += 1
+        P[i] = j - 1
+
+
+@njit(cache=True)
+def _q_sweep(Zplus, Zminus, n_plus, n_minus, h_med, eps2, h_med_eps, Q):
+    """
+    Two-pointer sweep locating, for every row, the leftmost column
+    with kernel value below h_med, written into the Q buffer, with
+    the same amortization as _p_sweep in the opposite direction.
+    """
+
+    # Band edge, hoisted out of the scans
+    lower = h_med - h_med_eps
+
+    # Leftmost column in each row strictly less than h_med
+    j = n_minus - 1
+    for i in range(n_plus):
+        while j >= 0 and \
+                _cmp_below(Zplus, Zminus, n_plus, i, j, eps2, lower):
+            j -= 1
+        Q[i] = j + 1
+
+
+@njit("float64(float64[::1], float64[::1], int64, float64, float64)",
+      cache=True)
+def _medcouple_core(Zplus, Zminus, medc_idx, eps1, eps2):
+    """
+    The kth pair algorithm of Johnson & Mizoguchi on the centred,
+    sorted halves: iterates weighted medians of the row midpoints
+    and boundary sweeps until few candidates remain, then selects
+    the medc_idx-th kernel value. Compiled as one unit with an
+    explicit float64 signature, so the whole selection loop runs
+    without returning to the interpreter between iterations.
+    """
+
+    n_plus = Zplus.size
+    n_minus = Zminus.size
+
+    # Initial left and right borders of the candidate matrix
+    L = np.zeros(n_plus, dtype=np.int64)
+    R = np.full(n_plus, n_minus - 1, dtype=np.int64)
+
+    # Number of entries to the left of, and up to, the borders
+    Ltot = 0
+    Rtot = n_minus * n_plus
+
+    # Working buffers, allocated once and refilled per iteration
+    P = np.empty(n_plus, dtype=np.int64)
+    Q = np.empty(n_plus, dtype=np.int64)
+    A = np.empty(n_plus, dtype=np.float64)
+    W = np.empty(n_plus, dtype=np.int64)
+
+    while Rtot - Ltot > n_plus:
+
+        # Kernel value at the midpoint of each row that still has
+        # candidates, weighted by the number of candidates left
+        m = 0
+        for i in range(n_plus):
+            if L[i] <= R[i]:
+                A[m] = _h_pair(
+                    Zplus, Zminus, n_plus, i, (L[i] + R[i]) // 2, eps2)
+                W[m] = R[i] - L[i] + 1
+                m += 1
+
+        # Weighted median of the row midpoints
+        h_med = _wmedian(A[:m], W[:m])
+
+        # Tolerance for ties with the weighted median
+        h_med_eps = eps1 * (eps1 + abs(h_med))
+
+        # Compute the new right boundary, based on the weighted
+        # median; the Q sweep only runs when the P count does not
+        # already decide the branch
+        _p_sweep(
+            Zplus, Zminus, n_plus, n_minus, h_med, eps2,
+            h_med_eps, P)
+
+        # Entries up to P
+        sumP = n_plus
+        for i in range(n_plus):
+            sumP += P[i]
+
+        if medc_idx <= sumP - 1:
+
+            # The medcouple is above h_med: shrink from the right
+            for i in range(n_plus):
+                R[i] = P[i]
+            Rtot = sumP
+
+        else:
+
+            # Entries strictly left of Q
+            _q_sweep(
+                Zplus, Zminus, n_plus, n_minus, h_med, eps2,
+                h_med_eps, Q)
+            sumQ = 0
+            for i in range(n_plus):
+                sumQ += Q[i]
+
+            if medc_idx > sumQ - 1:
+
+                # The medcouple is below h_med: shrink from the left
+                for i in range(n_plus):
+                    L[i] = Q[i]
+                Ltot = sumQ
+
+            else:
+
+                # The medcouple is tied with h_med
+                return h_med
+
+    # Few candidates remain: gather them all
+    total = 0
+    for i in range(n_plus):
+        if R[i] >= L[i]:
+            total += R[i] - L[i] + 1
+
+    rest = np.empty(total, dtype=np.float64)
+    m = 0
+    for i in range(n_plus):
+        for j in range(L[i], R[i] + 1):
+            rest[m] = _h_pair(Zplus, Zminus, n_plus, i, j, eps2)
+            m += 1
+
+    # Rank medc_idx - Ltot in decreasing order is this rank in
+    # increasing order
+    k = total - 1 - (medc_idx - Ltot)
+
+    # Quickselect the single order statistic instead of sorting
+    return np.partition(rest, k)[k]
+
+
+# Warm the JIT cache at import so the first medcouple call does not
+# pay the compilation latency; _medcouple_core compiles eagerly from
+# its explicit signature
+_center_scale(np.zeros(1), 0.0, 1.0)
+_p_sweep(np.zeros(1), np.zeros(1), 1, 1, 0.0, 2.0 ** -1022, 0.0,
+         np.zeros(1, dtype=np.int64))
+_q_sweep(np.zeros(1), np.zeros(1), 1, 1, 0.0, 2.0 ** -1022, 0.0,
+         np.zeros(1, dtype=np.int64))
+
+
+def medcouple_nlogn(X, eps1=2 ** -52, eps2=2 ** -1022):
+    """
+    Computes the medcouple, a robust measure of skewness, in
+    O(n log n) time.
+
+    Brys, G., Hubert, M., & Struyf, A. (2004). A robust measure of skewness. Journal of Computational and Graphical Statistics, 13(4), 996-1017.
+
+    Parameters:
+    - X (sequence of float): Sample values
+    - eps1, eps2 (float): Relative and absolute tolerances for ties
+
+    Returns:
+    - float: The medcouple of X, in [-1, 1]
+    """
+
+    # Sort in decreasing order, materialized contiguously: a bare
+    # [::-1] would leave a negative-stride view, pushing every
+    # later pass over Z (and the views into it) onto the strided
+    # ufunc path instead of the contiguous SIMD one
+    Z = np.sort(np.asarray(X, dtype=np.float64))[::-1].copy()
+
+    # Sample size
+    n = Z.size
+
+    # Median index
+    n2 = (n - 1) // 2
+
+    # The medcouple is undefined for tiny samples
+    if n < 3:
+        return 0
+
+    # Median of the sample
+    if n % 2 == 1:
+        Zmed = Z[n2]
+    else:
+        Zmed = (Z[n2] + Z[n2 + 1]) / 2
+
+    # If the median equals the largest value, all mass is on the left
+    if abs(Z[0] - Zmed) < eps1 * (eps1 + abs(Zmed)):
+        return -1.0
+
+    # If the median equals the smallest value, all mass is on the right
+    if abs(Z[n - 1] - Zmed) < eps1 * (eps1 + abs(Zmed)):
+        return 1.0
+
+    # Centre Z around the median and scale inside [-0.5, 0.5], in
+    # one in-place pass; the medcouple is invariant to shifts and
+    # scale
+    Zden = 2 * max(Z[0] - Zmed, Zmed - Z[n - 1])
+    _center_scale(Z, Zmed, Zden)
+    Zmed /= Zden
+
+    # Tolerance for ties with the median
+    Zeps = eps1 * (eps1 + abs(Zmed))
+
+    # Z is sorted decreasing, so the entries >= -Zeps are a prefix
+    # and the entries <= Zeps a suffix; both splits fall out of a
+    # binary search on the ascending view, and Zplus/Zminus stay
+    # zero-copy views. They overlap on the entries that are tied
+    # with the median.
+    ascending = Z[::-1]
+    n_plus = int(n - np.searchsorted(ascending, -Zeps, side="left"))
+    n_minus = int(np.searchsorted(ascending, Zeps, side="right"))
+    Zplus = Z[:n_plus]
+    Zminus = Z[n - n_minus:]
+
+    # Rank of the medcouple among all kernel values
+    medc_idx = (n_plus * n_minus) // 2
+
+    # Hand the sorted halves to the compiled selection loop
+    return _medcouple_core(Zplus, Zminus, medc_idx, eps1, eps2)
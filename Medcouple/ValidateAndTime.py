@@ -0,0 +1,192 @@
+# Validation and timing harness for the fast medcouple.
+#
+# Runs the O(n log n) medcouple and a brute-force O(n^2) reference
+# over every array found in DATA_DIR (one whitespace-separated text
+# file per sample), records both values and their timings, and
+# writes the results to OUTPUT_CSV.
+#
+# Created: August 28, 2026
+#
+# Python Version: 3.12
+#
+# Dependencies: pandas, numpy
+#
+# Author: Mustafa Hussain <h.mustafa.mail@gmail.com>
+#
+# License: CC BY-SA https://creativecommons.org/licenses/by-sa/4.0/
+#
+# You are free to share and adapt as long as you give appropriate
+# credit to the author and any derivatives of this work are shared
+# under the same license as the original.
+#
+# Disclaimer: The software is provided "as is", without warranty
+# of any kind, express or implied, including but not limited
+# to the warranties of merchantability, fitness for a particular
+# purpose and noninfringement. In no event shall the authors or
+# copyright holders be liable for any claim, damages or other
+# liability, whether in an action of contract, tort or otherwise,
+# arising from, out of or in connection with the software or the
+# use or other dealings in the software.
+
+
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from Medcouple_NLogN import medcouple_nlogn
+
+
+# Directory of input arrays
+DATA_DIR = "data"
+
+# Where the validation results land
+OUTPUT_CSV = "validation_results.csv"
+
+# Result columns, in output order
+fieldnames = [
+    "file", "n", "medcouple_fast", "medcouple_brute",
+    "abs_diff", "time_fast", "time_brute",
+]
+
+
+def medcouple_brute(X, eps1=2 ** -52, eps2=2 ** -1022):
+    """
+    Brute-force O(n^2) medcouple: materializes the full kernel
+    matrix and picks the same order statistic as the fast
+    implementation.
+
+    Parameters:
+    - X (sequence of float): Sample values
+    - eps1, eps2 (float): Relative and absolute tolerances for ties
+
+    Returns:
+    - float: The medcouple of X, in [-1, 1]
+    """
+
+    # Sort in decreasing order
+    X = np.sort(np.asarray(X, dtype=np.float64))[::-1]
+
+    # Sample size
+    n = len(X)
+
+    # The medcouple is undefined for tiny samples
+    if n < 3:
+        return 0
+
+    # Median of the sample
+    n2 = (n - 1) // 2
+    if n % 2 == 1:
+        Zmed = X[n2]
+    else:
+        Zmed = (X[n2] + X[n2 + 1]) / 2
+
+    # Degenerate cases: the median sits on an edge of the sample
+    if abs(X[0] - Zmed) < eps1 * (eps1 + abs(Zmed)):
+        return -1.0
+    if abs(X[n - 1] - Zmed) < eps1 * (eps1 + abs(Zmed)):
+        return 1.0
+
+    # Centre and scale, as in the fast implementation
+    Z = X - Zmed
+    Zden = 2 * max(Z[0], -Z[n - 1])
+    Z /= Zden
+    Zmed /= Zden
+
+    # Tolerance for ties with the median
+    Zeps = eps1 * (eps1 + abs(Zmed))
+
+    # These overlap on the entries that are tied with the median
+    Zplus = Z[Z >= -Zeps]
+    Zminus = Z[Zeps >= Z]
+    n_plus = len(Zplus)
+    n_minus = len(Zminus)
+
+    # Full kernel matrix
+    a = Zplus[:, None]
+    b = Zminus[None, :]
+    d = a - b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = (a + b) / d
+
+    # Signum tie-break for pairs within epsilon of each other
+    I, J = np.indices((n_plus, n_minus))
+    mask = np.abs(d) <= 2 * eps2
+    h[mask] = np.sign(n_plus - 1 - I[mask] - J[mask])
+
+    # Same order statistic as the fast implementation
+    h = np.sort(h, axis=None)[::-1]
+    return h[(n_plus * n_minus) // 2]
+
+
+def ensure_npy(fname):
+    """
+    One-time conversion of a text array to an .npy file alongside
+    it, so the benchmark loop never pays np.loadtxt's Python-level
+    parsing.
+    """
+
+    fpath = os.path.join(DATA_DIR, fname)
+
+    if not os.path.exists(fpath + ".npy"):
+        np.save(fpath + ".npy", np.loadtxt(fpath).ravel())
+
+
+def process(fname):
+    """
+    Runs and times both medcouple implementations on one input
+    file, returning one result row.
+    """
+
+    # Load the converted sample through numpy's binary reader
+    data = np.load(os.path.join(DATA_DIR, fname) + ".npy")
+
+    # Fast implementation
+    start = time.perf_counter()
+    mc_fast = medcouple_nlogn(data)
+    time_fast = time.perf_counter() - start
+
+    # Brute-force reference
+    start = time.perf_counter()
+    mc_brute = medcouple_brute(data)
+    time_brute = time.perf_counter() - start
+
+    return {
+        "file": fname,
+        "n": data.size,
+        "medcouple_fast": mc_fast,
+        "medcouple_brute": mc_brute,
+        "abs_diff": abs(mc_fast - mc_brute),
+        "time_fast": time_fast,
+        "time_brute": time_brute,
+    }
+
+
+def main():
+
+    # Input files, excluding any converted copies
+    fnames = sorted(
+        f for f in os.listdir(DATA_DIR) if not f.endswith(".npy"))
+
+    # Convert any inputs that have not been converted yet, so
+    # parsing cost never lands inside the measured loop
+    for fname in fnames:
+        ensure_npy(fname)
+
+    # One result row per input file, with the files fanned out
+    # across worker processes; the work is embarrassingly parallel
+    # and the timings are taken inside each task, so they stay
+    # accurate per file
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(process, fnames))
+
+    # Bulk write through pandas' C csv writer
+    pd.DataFrame(results, columns=fieldnames).to_csv(
+        OUTPUT_CSV, index=False)
+
+
+if __name__ == "__main__":
+    main()
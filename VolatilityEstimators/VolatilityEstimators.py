@@ -1,33 +1,333 @@
-# Collection of sophisticated volatility estimation methods. 
-# These functions yielded plausible results on historical data, 
-# but they have not been validated against standard 
+# Collection of sophisticated volatility estimation methods.
+# These functions yielded plausible results on historical data,
+# but they have not been validated against standard
 # implementations.
 #
 # Created: April 30, 2025
 #
 # Python Version: 3.12
 #
-# Dependencies: pandas, numpy
+# Dependencies: pandas, numpy, numba
 #
 # Author: Mustafa Hussain <h.mustafa.mail@gmail.com>
 #
 # License: CC BY-SA https://creativecommons.org/licenses/by-sa/4.0/
 #
-# You are free to share and adapt as long as you give appropriate 
-# credit to the author and any derivatives of this work are shared 
+# You are free to share and adapt as long as you give appropriate
+# credit to the author and any derivatives of this work are shared
 # under the same license as the original.
 #
-# Disclaimer: The software is provided "as is", without warranty 
-# of any kind, express or implied, including but not limited 
-# to the warranties of merchantability, fitness for a particular 
-# purpose and noninfringement. In no event shall the authors or 
-# copyright holders be liable for any claim, damages or other 
-# liability, whether in an action of contract, tort or otherwise, 
-# arising from, out of or in connection with the software or the 
+# Disclaimer: The software is provided "as is", without warranty
+# of any kind, express or implied, including but not limited
+# to the warranties of merchantability, fitness for a particular
+# purpose and noninfringement. In no event shall the authors or
+# copyright holders be liable for any claim, damages or other
+# liability, whether in an action of contract, tort or otherwise,
+# arising from, out of or in connection with the software or the
 # use or other dealings in the software.
 
 
+import math
+
 import numpy as np
+import pandas as pd
+
+from numba import njit
+
+# bottleneck's C ring-buffer moving windows are used when available;
+# the numba kernels below cover the same semantics otherwise
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+# Natural log of 2, evaluated once at import instead of per call
+_LOG2 = math.log(2.0)
+
+# Parkinson scaling constant 1 / (4 ln 2)
+_PARKINSON_FACTOR = 0.25 / _LOG2
+
+# Garman-Klass close-open coefficient 2 ln 2 - 1
+_GK_CO_COEF = 2.0 * _LOG2 - 1.0
+
+
+@njit(cache=True)
+def _rolling_mean(x, window):
+    """
+    Rolling mean of x over the given window, as one O(n) pass over a
+    running sum rather than an O(n * window) rescan.
+
+    Windows containing NaN yield NaN, and the first window - 1
+    entries are NaN, matching pandas' rolling default. The running
+    sum is recomputed from scratch every 2048 steps to keep
+    accumulated rounding error bounded.
+    """
+
+    n = x.size
+    out = np.full(n, np.nan)
+
+    # Running window sum and count of NaNs currently in the window
+    s = 0.0
+    nan_count = 0
+
+    for i in range(n):
+
+        # Add the entering value
+        if np.isnan(x[i]):
+            nan_count += 1
+        else:
+            s += x[i]
+
+        # Drop the leaving value
+        if i >= window:
+            if np.isnan(x[i - window]):
+                nan_count -= 1
+            else:
+                s -= x[i - window]
+
+        if i >= window - 1:
+
+            # Periodic fresh summation bounds rounding drift
+            if i % 2048 == 0:
+                s = 0.0
+                for j in range(i - window + 1, i + 1):
+                    if not np.isnan(x[j]):
+                        s += x[j]
+
+            if nan_count == 0:
+                out[i] = s / window
+
+    return out
+
+
+@njit(cache=True)
+def _rolling_var(x, window):
+    """
+    Rolling sample variance (ddof=1) of x over the given window, as
+    one O(n) pass updating running sums of x and x squared rather
+    than an O(n * window) per-window computation.
+
+    Windows containing NaN yield NaN, and the first window - 1
+    entries are NaN, matching pandas' rolling default. The running
+    sums are recomputed from scratch every 2048 steps to keep
+    accumulated rounding error bounded, and tiny negative results
+    from cancellation are clamped to zero.
+    """
+
+    n = x.size
+    out = np.full(n, np.nan)
+
+    # The sample variance is undefined for degenerate windows
+    if window < 2:
+        return out
+
+    # Running window sums and count of NaNs currently in the window
+    s = 0.0
+    ss = 0.0
+    nan_count = 0
+
+    for i in range(n):
+
+        # Add the entering value
+        if np.isnan(x[i]):
+            nan_count += 1
+        else:
+            s += x[i]
+            ss += x[i] * x[i]
+
+        # Drop the leaving value
+        if i >= window:
+            if np.isnan(x[i - window]):
+                nan_count -= 1
+            else:
+                s -= x[i - window]
+                ss -= x[i - window] * x[i - window]
+
+        if i >= window - 1:
+
+            # Periodic fresh summation bounds rounding drift
+            if i % 2048 == 0:
+                s = 0.0
+                ss = 0.0
+                for j in range(i - window + 1, i + 1):
+                    if not np.isnan(x[j]):
+                        s += x[j]
+                        ss += x[j] * x[j]
+
+            if nan_count == 0:
+                var = (ss - s * s / window) / (window - 1)
+                out[i] = var if var > 0.0 else 0.0
+
+    return out
+
+
+# Warm the JIT cache at import so the first estimator call does not
+# pay the compilation latency
+_rolling_mean(np.zeros(2), 2)
+_rolling_var(np.zeros(2), 2)
+
+
+def _moving_mean(x, window):
+    """
+    Rolling mean over the window: bottleneck's move_mean when
+    installed, otherwise the numba kernel. min_count=window keeps
+    NaN windows and the first window - 1 entries NaN either way.
+    """
+
+    if bn is not None:
+        return bn.move_mean(x, window, min_count=window)
+
+    return _rolling_mean(x, window)
+
+
+def _moving_var(x, window):
+    """
+    Rolling sample variance (ddof=1) over the window: bottleneck's
+    move_var when installed, otherwise the numba kernel.
+    """
+
+    if bn is not None:
+        return bn.move_var(x, window, min_count=window, ddof=1)
+
+    return _rolling_var(x, window)
+
+
+class _LogCache:
+    """
+    Log prices for one OHLC DataFrame, computed once and shared
+    across estimators, so that a caller evaluating several methods
+    on the same candles pays for each np.log array only once.
+    """
+
+    __slots__ = ("index", "lo", "lh", "ll", "lc", "lc_prev")
+
+    def __init__(self, candles_dataframe):
+
+        # All four price columns in one contiguous block
+        values = candles_dataframe[
+            ["open", "high", "low", "close"]].to_numpy(dtype=np.float64)
+
+        # One log pass over the block
+        logs = np.log(values)
+
+        # Per-column log arrays
+        self.lo, self.lh, self.ll, self.lc = logs.T
+
+        # Previous close in log space
+        self.lc_prev = np.concatenate(([np.nan], self.lc[:-1]))
+
+        # Original index, for wrapping results back into a Series
+        self.index = candles_dataframe.index
+
+
+def _log_series(prices):
+    """
+    Log of a price series as a float64 ndarray. Accepts a pd.Series
+    or anything np.asarray can promote, so all arithmetic past this
+    boundary runs on plain ndarrays with no pandas alignment
+    machinery.
+    """
+
+    return np.log(np.asarray(prices, dtype=np.float64))
+
+
+def _series_index(prices):
+    """
+    Index of a price series, or None for plain arrays (pd.Series
+    then falls back to a RangeIndex on the way out).
+    """
+
+    return getattr(prices, "index", None)
+
+
+def _parkinson_core(lh, ll, window):
+    """
+    Parkinson volatility over log-price arrays.
+    """
+
+    # Squared log range
+    hl_squared = (lh - ll) ** 2
+
+    # Return rolling standard deviation
+    return np.sqrt(_PARKINSON_FACTOR * _moving_mean(hl_squared, window))
+
+
+def _garman_klass_core(lo, lh, ll, lc, window):
+    """
+    Garman-Klass volatility over log-price arrays.
+    """
+
+    # Per-bar variance, fused into one expression so the high-low
+    # and close-open terms are not materialized separately
+    variance = 0.5 * (lh - ll) ** 2 - _GK_CO_COEF * (lc - lo) ** 2
+
+    # Standard deviation
+    return np.sqrt(_moving_mean(variance, window))
+
+
+def _rogers_satchell_core(lo, lh, ll, lc, window):
+    """
+    Rogers-Satchell volatility over log-price arrays.
+    """
+
+    # The Rogers-Satchell series u * (u - c) + d * (d - c), fused
+    # into one expression over the log arrays
+    rs = (lh - lo) * (lh - lc) + (ll - lo) * (ll - lc)
+
+    # The standard deviation series is the root of the rolling mean
+    return np.sqrt(_moving_mean(rs, window))
+
+
+def _garman_klass_yang_zhang_core(lo, lh, ll, lc, lc_prev, window):
+    """
+    Garman-Klass-Yang-Zhang volatility over log-price arrays.
+    """
+
+    # Per-bar variance, fused into one expression so the gap,
+    # high-low, and close-open terms are not materialized separately
+    per_bar_var = (
+        (lo - lc_prev) ** 2
+        + 0.5 * (lh - ll) ** 2
+        - _GK_CO_COEF * (lc - lo) ** 2
+    )
+
+    # To take the rolling variance, take the rolling mean of per-bar variance estimates
+    rolling_variance = _moving_mean(per_bar_var, window)
+
+    # Convert to standard deviation
+    return np.sqrt(rolling_variance)
+
+
+def _yang_zhang_core(lo, lh, ll, lc, lc_prev, window, alpha):
+    """
+    Yang-Zhang volatility over log-price arrays.
+    """
+
+    # Gap series
+    o_s = lo - lc_prev
+
+    # Close-open series
+    c_s = lc - lo
+
+    # Rolling variance of gap series
+    v_o = _moving_var(o_s, window)
+
+    # Rolling variance of close-open series
+    v_c = _moving_var(c_s, window)
+
+    # Rogers-Satchell variance, on the same log arrays
+    rs = (lh - lo) * (lh - lc) + (ll - lo) * (ll - lc)
+    v_rs = _moving_mean(rs, window)
+
+    # Weighting factor for drift
+    k = (alpha - 1) / (alpha + (window + 1) / (window - 1))
+
+    # Construct Yang-Zhang variance by combining weighted components
+    yz_var = v_o + (k * v_c) + ((1-k) * v_rs)
+
+    # Return standard deviation
+    return np.sqrt(yz_var)
 
 
 def parkinson_volatility(high, low, window=10):
@@ -44,14 +344,10 @@ def parkinson_volatility(high, low, window=10):
     - pd.Series: Parkinson volatility (not annualized)
     """
 
-    # Constant
-    factor = 1 / (4 * np.log(2))
-
-    # Squared log range
-    hl_squared = np.log(high / low) ** 2
-
-    # Return rolling standard deviation
-    return np.sqrt(factor * hl_squared.rolling(window).mean())
+    return pd.Series(
+        _parkinson_core(_log_series(high), _log_series(low), window),
+        index=_series_index(high),
+    )
 
 
 def garman_klass_volatility(open_, high, low, close, window=10):
@@ -68,20 +364,12 @@ def garman_klass_volatility(open_, high, low, close, window=10):
     - pd.Series: Garman-Klass volatility (not annualized)
     """
 
-    # High-low term
-    hl_term = np.log(high / low) ** 2
-
-    # Close-open term
-    co_term = np.log(close / open_) ** 2
-
-    # Close-open coefficient
-    coef = (2 * np.log(2)) - 1
-
-    # Compute variance
-    variance = (0.5 * hl_term) - (coef * co_term)
-
-    # Standard deviation
-    return np.sqrt(variance.rolling(window).mean())
+    return pd.Series(
+        _garman_klass_core(
+            _log_series(open_), _log_series(high),
+            _log_series(low), _log_series(close), window),
+        index=_series_index(close),
+    )
 
 
 def rogers_satchell_volatility(open_, high, low, close, window=10):
@@ -98,20 +386,12 @@ def rogers_satchell_volatility(open_, high, low, close, window=10):
     - pd.Series: Rolling Rogers-Satchell volatility (not annualized)
     """
 
-    # High-open series
-    u = np.log(high) - np.log(open_)
-
-    # Low-open series
-    d = np.log(low) - np.log(open_)
-
-    # Close-open series
-    c = np.log(close) - np.log(open_)
-
-    # The Rogers Satchell series
-    rs = u * (u - c) + d * (d - c)
-
-    # The standard deviation series is the root of the rolling mean
-    return np.sqrt(rs.rolling(window).mean())
+    return pd.Series(
+        _rogers_satchell_core(
+            _log_series(open_), _log_series(high),
+            _log_series(low), _log_series(close), window),
+        index=_series_index(close),
+    )
 
 
 def garman_klass_yang_zhang_volatility(open_, high, low, close, window=10):
@@ -128,26 +408,16 @@ def garman_klass_yang_zhang_volatility(open_, high, low, close, window=10):
     - pd.Series: GKYZ volatility (not annualized)
     """
 
-    # Gap term
-    gap_sq = np.log(open_ / close.shift(1)) ** 2
+    # Previous close in log space
+    lc = _log_series(close)
+    lc_prev = np.concatenate(([np.nan], lc[:-1]))
 
-    # High-low term
-    hl_sq = np.log(high / low) ** 2
-
-    # Close-open term
-    co_sq = np.log(close / open_) ** 2
-
-    # Close-open coefficient
-    co_coef = (2 * np.log(2)) - 1
-
-    # Per-bar variance
-    per_bar_var = gap_sq + 0.5 * hl_sq - co_coef * co_sq
-
-    # To take the rolling variance, take the rolling mean of per-bar variance estimates
-    rolling_variance = per_bar_var.rolling(window).mean()
-
-    # Convert to standard deviation
-    return np.sqrt(rolling_variance)
+    return pd.Series(
+        _garman_klass_yang_zhang_core(
+            _log_series(open_), _log_series(high),
+            _log_series(low), lc, lc_prev, window),
+        index=_series_index(close),
+    )
 
 
 def yang_zhang_volatility(open_, high, low, close, window, alpha=1.34):
@@ -165,30 +435,16 @@ def yang_zhang_volatility(open_, high, low, close, window, alpha=1.34):
     - pd.Series: Yang-Zhang volatility (not annualized)
     """
 
-    # Gap series
-    o_s = np.log(open_) - np.log(close.shift(1))
-
-    # Close-open series
-    c_s = np.log(close) - np.log(open_)
-
-    # Rolling variance of gap series
-    v_o = o_s.rolling(window).var()
-
-    # Rolling variance of close-open series
-    v_c = c_s.rolling(window).var()
-
-    # Rogers-Satchell volatility
-    v_rs = rogers_satchell_volatility(
-        open_, high, low, close, window) ** 2
-
-    # Weighting factor for drift
-    k = (alpha - 1) / (alpha + (window + 1) / (window - 1))
-
-    # Construct Yang-Zhang variance by combining weighted components
-    yz_var = v_o + (k * v_c) + ((1-k) * v_rs)
+    # Previous close in log space
+    lc = _log_series(close)
+    lc_prev = np.concatenate(([np.nan], lc[:-1]))
 
-    # Return standard deviation
-    return np.sqrt(yz_var)
+    return pd.Series(
+        _yang_zhang_core(
+            _log_series(open_), _log_series(high),
+            _log_series(low), lc, lc_prev, window, alpha),
+        index=_series_index(close),
+    )
 
 
 def volatility_mux(candles_dataframe, window=10, method="yang-zhang"):
@@ -218,56 +474,52 @@ def volatility_mux(candles_dataframe, window=10, method="yang-zhang"):
         # Raise error.
         raise ValueError(f"Input DataFrame must contain columns: {required_cols}")
 
+    # Log prices, computed once and shared by whichever estimator
+    # runs
+    logs = _LogCache(candles_dataframe)
+
     match method:
 
         case "parkinson":
 
-            return parkinson_volatility(
-                high=candles_dataframe["high"],
-                low=candles_dataframe["low"],
-                window=window,
+            return pd.Series(
+                _parkinson_core(logs.lh, logs.ll, window),
+                index=logs.index,
             )
 
         case "garman-klass":
 
-            return garman_klass_volatility(
-                open_=candles_dataframe["open"],
-                high=candles_dataframe["high"],
-                low=candles_dataframe["low"],
-                close=candles_dataframe["close"],
-                window=window,
+            return pd.Series(
+                _garman_klass_core(
+                    logs.lo, logs.lh, logs.ll, logs.lc, window),
+                index=logs.index,
             )
 
         case "rogers-satchell":
 
-            return rogers_satchell_volatility(
-                open_=candles_dataframe["open"],
-                high=candles_dataframe["high"], 
-                low=candles_dataframe["low"],
-                close=candles_dataframe["close"],
-                window=window,
+            return pd.Series(
+                _rogers_satchell_core(
+                    logs.lo, logs.lh, logs.ll, logs.lc, window),
+                index=logs.index,
             )
 
         case "garman-klass-yang-zhang":
 
-            return garman_klass_yang_zhang_volatility(
-                open_=candles_dataframe["open"],
-                high=candles_dataframe["high"],
-                low=candles_dataframe["low"],
-                close=candles_dataframe["close"],
-                window=window,
+            return pd.Series(
+                _garman_klass_yang_zhang_core(
+                    logs.lo, logs.lh, logs.ll, logs.lc,
+                    logs.lc_prev, window),
+                index=logs.index,
             )
 
         case "yang-zhang":
 
-            return yang_zhang_volatility(
-                open_=candles_dataframe["open"],
-                high=candles_dataframe["high"],
-                low=candles_dataframe["low"],
-                close=candles_dataframe["close"],
-                window=window,
+            return pd.Series(
+                _yang_zhang_core(
+                    logs.lo, logs.lh, logs.ll, logs.lc,
+                    logs.lc_prev, window, alpha=1.34),
+                index=logs.index,
             )
 
         case _:
             raise ValueError(f"Method {method} not recognized.")
-          